@@ -1,3 +1,5 @@
+import collections
+import functools
 import os
 import re
 from typing import Type
@@ -21,6 +23,56 @@ from .browser_support._webdrivercreator import WebDriverCreator
 from .site_specific import SiteBehaviour
 
 
+# sentinel for attribute lookups where `None` is a valid value
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_log():
+    """
+    Browser's logger. `Logger.get_logger` inspects the call stack to name the
+    logger, so it is resolved once on first use rather than for every Browser.
+    """
+    return Logger.get_logger()
+
+
+def _public_names(klass):
+    """
+    Return the public attribute names defined along ``klass``'s hierarchy,
+    in MRO order and without duplicates. Names starting with an underscore
+    are helper methods and are omitted.
+    """
+    names = []
+    seen = set()
+    for base in klass.__mro__[:-1]:  # skip `object`
+        for name in vars(base):
+            if name in seen or name.startswith('_'):
+                continue
+            seen.add(name)
+            names.append(name)
+    return tuple(names)
+
+
+def _first_writers(mixins, reserved):
+    """
+    Map every public name found in ``mixins`` to the index of the first mixin
+    defining it. Names in ``reserved`` belong to Browser itself and are never
+    mirrored.
+    """
+    members = {}
+    for index, klass in enumerate(mixins):
+        for name in _public_names(klass):
+            if name not in reserved and name not in members:
+                members[name] = index
+    return members
+
+
+# attributes set on every Browser instance by Browser.__init__
+_BROWSER_ATTRIBUTES = ('driver', 'implicit_wait', 'log', 'speed', 'timeout',
+                       'screenshot_directory', 'report_directory',
+                       'cookie_directory')
+
+
 class Browser:
     """
     Selenium Webdriver Controller
@@ -74,7 +126,8 @@ class Browser:
     === Available methods ===
 
     A browser instance will have all the methods not pre-fixed with an
-    underscore (_) defined in the following classes/files:
+    underscore (_) defined in the following classes/files. They are resolved
+    on first access through `Browser.__getattr__`:
 
         _____CLASS_NAME_________|____FILE_NAME______________|___HIERARCHY_____
             Driver              |   _driver.py              |   root
@@ -115,32 +168,49 @@ class Browser:
 
     """
 
+    # mixin methods are delegated by __getattr__ and never stored on the
+    # instance, so only Browser's own state needs a slot
+    __slots__ = _BROWSER_ATTRIBUTES + ('site_specific_behaviour', '_mixins',
+                                       '_site_cache', '_element_cache',
+                                       '__weakref__')
+
+    _MIXIN_CLASSES = (Alert, BrowserManagement, Cookies, Element, Frames,
+                      Javascript, Screenshot, Selects, Tables, Testing,
+                      Waiting, WindowManager)
+
     def __init__(self, browser='ff', profile=None, options=None, ip=None):
         self.driver = WebDriverCreator().create_driver(
             browser, profile, options, ip
         )
         self.implicit_wait = 0
-        self.log = Logger.get_logger()
+        self.log = _get_log()
         self.speed = os.environ.get('DEFAULT_SPEED', 0.0)  # TODO add a session speed controller
         self.timeout = os.environ.get('SELENIUM2_DEFAULT_TIMEOUT', 15)
         self.screenshot_directory = os.environ.get('SELENIUM2_SCREENSHOT_PATH', 'screenshots')
         self.report_directory = os.environ.get('SELENIUM2_REPORT_PATH', 'reports')
         self.cookie_directory = os.environ.get('SELENIUM2_COOKIE_PATH', 'cookies')
-        libraries = [
-            Alert(self),
-            BrowserManagement(self),
-            Cookies(self),
-            Element(self),
-            Frames(self),
-            Javascript(self),
-            Screenshot(self),
-            Selects(self),
-            Tables(self),
-            Testing(self),
-            Waiting(self),
-            WindowManager(self),
-        ]
-        self.get_attributes(libraries)
+        self._mixins = tuple(klass(self) for klass in self._MIXIN_CLASSES)
+        self._site_cache = {}
+        # locator -> (element, time found), filled by find_element(cached=True)
+        # in least recently used order
+        self._element_cache = collections.OrderedDict()
+
+    def __getattr__(self, name):
+        """
+        Delegate public mixin methods to the mixin instance defining them.
+
+        Only called when regular lookup fails, so Browser's own attributes
+        always win. `_MIXIN_MEMBERS` resolves the owning mixin with a single
+        dict hit and bound methods are only created when actually used.
+        """
+        index = _MIXIN_MEMBERS.get(name)
+        if index is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no "
+                                 f"attribute '{name}'")
+        return getattr(self._mixins[index], name)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(_MIXIN_MEMBERS))
 
     def __enter__(self):
         return self
@@ -172,8 +242,14 @@ class Browser:
             def post(self, details: dict) -> str: ...
             def sign_in(self, details: dict, cookies: str = None) -> NoReturn: ...
             def sign_out(self) -> NoReturn: ...
+
+        Each behaviour is instantiated once per Browser; switching back to a
+        previously set behaviour reuses the same instance.
         """
-        self.site_specific_behaviour = behaviour(self)
+        instance = self._site_cache.get(behaviour)
+        if instance is None:
+            instance = self._site_cache[behaviour] = behaviour(self)
+        self.site_specific_behaviour = instance
 
     def create_account(self, details: dict, cookies: str = None):
         """
@@ -252,38 +328,15 @@ class Browser:
         :param method_name: name of the method to call
         :param args: arguments to pass to the method
         """
-        if hasattr(self.site_specific_behaviour, method_name):
-            method = getattr(self.site_specific_behaviour, method_name)
-            if callable(method):
-                return method(*args, **kwargs)
-            else:
-                raise RuntimeError("Attribute `%s` of site `%s` is not callable."
-                                   % (method_name, self.site_specific_behaviour.name))
-        else:
-            raise RuntimeError("Site `%s` does not have an attribute named `%s`."
-                               % (self.site_specific_behaviour.name, method_name))
-
-    def get_attributes(self, libraries):
-        """
-        Will parse every method in ``libraries`` and append those that
-        don't start with an underscore (_) to `self`.
-
-        All methods defined in ``libraries`` that start with an underscore are
-        considered `helper methods` to `core methods` and should not be used
-        directly by `self`, hence, are omitted.
-
-        This also applied to attributes.
-        """
-        for library in libraries:
-            for name, value in self.get_members(library):
-                if not hasattr(self, name) and not name.startswith('_'):
-                    # avoid overwriting existing attributes and exclude _named attributes
-                    setattr(self, name, value)
-
-    def get_members(self, library):
-        """Get the name:value pairs of the methods in the instance provided."""
-        for name in dir(library):
-            yield name, getattr(library, name)
+        method = getattr(self.site_specific_behaviour, method_name, _MISSING)
+        if method is _MISSING:
+            raise RuntimeError(f'Site `{self.site_specific_behaviour.name}` does '
+                               f'not have an attribute named `{method_name}`.')
+        if not callable(method):
+            raise RuntimeError(f'Attribute `{method_name}` of site '
+                               f'`{self.site_specific_behaviour.name}` is not '
+                               f'callable.')
+        return method(*args, **kwargs)
 
     def set_implicit_wait(self, time_to_wait):
         """
@@ -306,5 +359,8 @@ class Browser:
         self.implicit_wait = 0
 
 
-
-
+# public mixin names and the index of the mixin serving them, resolved once at
+# import instead of reflecting over the mixins every time a Browser is created
+_MIXIN_MEMBERS = _first_writers(
+    Browser._MIXIN_CLASSES,
+    reserved=set(vars(Browser)) | set(_BROWSER_ATTRIBUTES))
@@ -1,4 +1,4 @@
-from typing import Any, Callable, List, NamedTuple, NoReturn, Union as U, Tuple, Type
+from typing import Any, Callable, Dict, List, NamedTuple, NoReturn, Union as U, Tuple, Type
 from selenium.webdriver.common.alert import Alert
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -17,7 +17,6 @@ class Browser:
     cookie_directory: str = ...
     timeout: bool = ...
 
-    def assert_proxy_is(self, ip:str)->NoReturn: ...
     def set_implicit_wait(self, time_to_wait: int) -> NoReturn: ...
     def unset_implicit_wait(self) -> NoReturn: ...
 
@@ -37,13 +36,16 @@ class Browser:
     def site_custom(self, method_name, *args) -> Any: ...
 
     """ from base.py """
-    def find_element(self, locator: U[WebElement, str], required: bool=True,
-                     parent: U[WebDriver, WebElement]=None) -> WebElement : ...
-    def find_elements(self, locator: str, required: bool=False,
+    def find_element(self, locator: U[WebElement, str, Tuple[str, str]], required: bool=True,
+                     parent: U[WebDriver, WebElement]=None, cached: bool=False) -> WebElement : ...
+    def find_elements(self, locator: U[WebElement, str, Tuple[str, str]], required: bool=False,
                       parent: U[WebDriver, WebElement]=None) -> List[WebElement] : ...
-    def is_text_present(self, text: str) -> bool: ...
+    def find_first_of(self, locators: List[U[WebElement, str, Tuple[str, str]]], required: bool=True,
+                      parent: U[WebDriver, WebElement]=None) -> WebElement : ...
+    def is_text_present(self, text: str, rendered: bool=True) -> bool: ...
     def is_enabled(self, locator: U[WebElement, str]) -> bool: ...
     def is_visible(self, locator: U[WebElement, str]) -> bool: ...
+    def clear_element_cache(self) -> NoReturn: ...
 
     """ from alert.py """
     def get_alert(self, timeout: int=DEFAULT_TIMEOUT, message: str ='') -> Alert: ...
@@ -75,33 +77,39 @@ class Browser:
     def set_cookies_expiry(self, date: int=3735325880) -> NoReturn: ...
 
     """ from element.py """
-    def clear_element_text(self, locator: U[WebElement, str]) -> NoReturn: ...
-    def click_element(self, locator: U[WebElement, str]) -> NoReturn: ...
+    def bulk_actions(self, actions: List[Dict[str, Any]]) -> NoReturn: ...
+    def bulk_click(self, *locators: U[WebElement, str]) -> NoReturn: ...
+    def bulk_send_keys(self, fields: U[Dict[U[WebElement, str], str],
+                                       List[Tuple[U[WebElement, str], str]]]) -> NoReturn: ...
+    def clear_element_text(self, locator: U[WebElement, str], cached: bool=False) -> NoReturn: ...
+    def click_element(self, locator: U[WebElement, str], cached: bool=False) -> NoReturn: ...
     def click_element_at_coordinates(self, locator: U[WebElement, str],
                                      xoffset: int, yoffset: int) -> NoReturn: ...
-    def double_click_element(self, locator: U[WebElement, str]) -> NoReturn: ...
+    def double_click_element(self, locator: U[WebElement, str], cached: bool=False) -> NoReturn: ...
     def drag_and_drop(self, locator: U[WebElement, str],
                       target: U[WebElement, str]) -> NoReturn: ...
     def element_text_contains(self, locator: U[WebElement, str], expected: str,
                               ignore_case: bool=True) -> bool: ...
     def element_text_is(self, locator: U[WebElement, str], expected: str,
                         ignore_case: bool=False) -> bool: ...
-    def get_element_attribute(self, locator: U[WebElement, str], attribute: str) -> str: ...
-    def get_element_property(self, locator: U[WebElement, str], prop: str) -> str: ...
-    def get_element_size(self, locator: U[WebElement, str]) -> (int, int): ...
-    def get_text(self, locator: U[WebElement, str]) -> str: ...
+    def get_element_attribute(self, locator: U[WebElement, str], attribute: str,
+                              cached: bool=False) -> str: ...
+    def get_element_property(self, locator: U[WebElement, str], prop: str,
+                             cached: bool=False) -> str: ...
+    def get_element_size(self, locator: U[WebElement, str], cached: bool=False) -> (int, int): ...
+    def get_text(self, locator: U[WebElement, str], cached: bool=False) -> str: ...
     def page_contains_text(self, text:str) -> bool: ...
     def right_click_element_at_coordinates(self, locator: U[WebElement, str],
                                            xoffset: int, yoffset: int) -> NoReturn: ...
     def send_keys(self, locator: U[WebElement, str]=None,
                   *keys: U[List[str], str]) -> NoReturn: ...
     def highlight_elements(self, locator: U[List[WebElement], WebElement, str]) -> NoReturn: ...
-    def set_focus_to_element(self, locator: U[WebElement, str]) -> NoReturn: ...
-    def mouse_down(self, locator: U[WebElement, str]) -> NoReturn: ...
-    def mouse_out(self, locator: U[WebElement, str]) -> NoReturn: ...
-    def mouse_over(self, locator: U[WebElement, str]) -> NoReturn: ...
-    def mouse_up(self, locator: U[WebElement, str]) -> NoReturn: ...
-    def scroll_element_into_view(self, locator: U[WebElement, str]) -> NoReturn: ...
+    def set_focus_to_element(self, locator: U[WebElement, str], cached: bool=False) -> NoReturn: ...
+    def mouse_down(self, locator: U[WebElement, str], cached: bool=False) -> NoReturn: ...
+    def mouse_out(self, locator: U[WebElement, str], cached: bool=False) -> NoReturn: ...
+    def mouse_over(self, locator: U[WebElement, str], cached: bool=False) -> NoReturn: ...
+    def mouse_up(self, locator: U[WebElement, str], cached: bool=False) -> NoReturn: ...
+    def scroll_element_into_view(self, locator: U[WebElement, str], cached: bool=False) -> NoReturn: ...
     def simulate_event(self, locator: U[WebElement, str], event: str) -> NoReturn: ...
 
     """ from frames.py """
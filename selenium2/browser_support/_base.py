@@ -1,14 +1,188 @@
-import re
+import contextlib
+import functools
+import sys
+import time
+from types import MappingProxyType
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import (NoSuchElementException,
+                                        StaleElementReferenceException)
 
 from ..logger import Logger
 from ._driver import Driver
 
+# first character of a locator -> strategy it is a shortcut for
+_LOCATOR_SHORTCUTS = MappingProxyType({
+    '/': 'xpath', '(': 'xpath', '.': 'xpath',
+    '#': 'id',
+    '@': 'link',
+})
+
+
+def _escape_css_value(value):
+    # quote ``value`` as a css string usable in an attribute selector. \n, \r
+    # and \f all end a line in css and can't appear raw inside a string.
+    value = (value.replace('\\', '\\\\').replace('"', '\\"')
+             .replace('\n', '\\a ').replace('\r', '\\d ').replace('\f', '\\c '))
+    return f'"{value}"'
+
+
+def _identifier_selector(value):
+    # match on either id or name with a single query instead of one
+    # round-trip per attribute. A css selector list lets the browser use
+    # its id/name lookups where an xpath `or` would scan every node.
+    value = _escape_css_value(value)
+    return f'[id={value}], [name={value}]'
+
+
+# locator strategy -> (selenium `By` it runs as, function rewriting the query
+# for it or None to send the query as is)
+_STRATEGY_QUERIES = MappingProxyType({
+    'identifier': (By.CSS_SELECTOR, _identifier_selector),
+    'id': (By.ID, None),
+    'name': (By.NAME, None),
+    'xpath': (By.XPATH, None),
+    'link': (By.LINK_TEXT, None),
+    'partial link': (By.PARTIAL_LINK_TEXT, None),
+    'css': (By.CSS_SELECTOR, None),
+    'class': (By.CLASS_NAME, None),
+    'tag': (By.TAG_NAME, None),
+})
+
+# every accepted spelling of a strategy -> key in _STRATEGY_QUERIES
+_STRATEGY_ALIAS = MappingProxyType({
+    # by identifier
+    'identifier': 'identifier',
+    # by id
+    'id': 'id', 'by id': 'id', 'by_id': 'id', '#': 'id',
+    # by name
+    'name': 'name', 'by name': 'name', 'by_name': 'name',
+    # by xpatch
+    'xpath': 'xpath', 'x': 'xpath', 'x path': 'xpath', 'path': 'xpath',
+    # by dom
+    'dom': 'dom',
+    # by link
+    'link': 'link', '@': 'link', 'link text': 'link',
+    # by partial link
+    'partial': 'partial link', 'partial link': 'partial link',
+    'plink': 'partial link', 'partial_link': 'partial link',
+    'partial link text': 'partial link',
+    # by css
+    'css': 'css', 'css path': 'css', 'css_path': 'css',
+    'css selector': 'css',
+    # by class name
+    'class name': 'class', 'class': 'class', 'class_name': 'class',
+    # by tag
+    'tag': 'tag', 'tag name': 'tag',
+})
+
+# every accepted spelling of a strategy -> its _STRATEGY_QUERIES entry, so
+# find_element resolves a strategy with a single lookup. Keys are interned,
+# as are the strategies _parse_locator returns, so lookups match on identity.
+# Left a plain dict (the tables above are read-only views) since _find hits it
+# on every call and a mappingproxy adds a layer of indirection
+_STRATEGY_DISPATCH = {
+    sys.intern(alias): _STRATEGY_QUERIES[strategy]
+    for alias, strategy in _STRATEGY_ALIAS.items()
+    if strategy in _STRATEGY_QUERIES
+}
+
+
+# find_element(cached=True) keeps at most this many locators, dropping the least
+# recently used first, and trusts a remembered element for this many seconds
+# after finding it before looking it up again
+_ELEMENT_CACHE_SIZE = 128
+_ELEMENT_CACHE_TTL = 10.0
+
+# first element matched by the [kind, query] pairs of arguments[1] ('xpath' or
+# 'css'), tried in order under arguments[0] or the document; false when the
+# browser can't evaluate xpath and the queries must go through webdriver
+_FIRST_OF_SCRIPT = """
+    var root = arguments[0] || document;
+    var queries = arguments[1];
+    for (var i = 0; i < queries.length; i++) {
+        var found;
+        if (queries[i][0] === 'xpath') {
+            if (!document.evaluate) {
+                return false;
+            }
+            found = document.evaluate(queries[i][1], root, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        } else {
+            found = root.querySelector(queries[i][1]);
+        }
+        if (found && found.nodeType === 1) {
+            return found;
+        }
+    }
+    return null;
+"""
+
+# enabled (`:disabled` also covers disabled fieldsets) and not read-only,
+# checked in one round-trip instead of is_enabled() + get_attribute()
+_IS_ENABLED_SCRIPT = """
+    var e = arguments[0];
+    var matches = e.matches || e.msMatchesSelector;
+    return !matches.call(e, ':disabled') && !e.hasAttribute('readonly');
+"""
+
+
+@functools.lru_cache(maxsize=1024)
+def _escape_xpath_value(value):
+    # https://stackoverflow.com/questions/14822153/escape-single-quote-in-xpath-with-nokogiri
+    # if you wanted to match the string: "That's mine", he said.,
+    # you would need to do something like:
+    #   text()=concat('"That', "'", 's mine", he said.')
+    # memoized as the same values are escaped over and over while polling
+    if '"' in value and '\'' in value:
+        parts_wo_apos = value.split('\'')
+        return f"concat('%s')" % "', \"'\", '".join(parts_wo_apos)
+    if '\'' in value:
+        return f"\"{value}\""
+    return f"'{value}'"
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_locator(locator):
+    # split ``locator`` into its strategy and query. Pure, so it is memoized:
+    # polling loops parse the same few locators over and over
+    shortcut = _LOCATOR_SHORTCUTS.get(locator[:1])
+    if shortcut == 'xpath':
+        return shortcut, locator
+    if shortcut is not None:
+        return shortcut, locator[1:]
+    # 'id:foo', 'css: .c' -- the usual, exact form
+    prefix, sep, query = locator.partition(':')
+    if query[:1] == ' ':
+        query = query[1:]
+    if sep and query and prefix in _STRATEGY_DISPATCH:
+        return sys.intern(prefix), query
+    # 'class name = spicy' returns 'class name' and 'spicy': the strategy
+    # ends at the first ':' or '=', each side may have one space around it
+    colon, equals = locator.find(':'), locator.find('=')
+    index = min(colon, equals) if colon >= 0 and equals >= 0 else max(colon, equals)
+    strategy, element = locator[:index], locator[index + 1:]
+    if strategy[-1:] == ' ':
+        strategy = strategy[:-1]
+    if element[:1] == ' ':
+        element = element[1:]
+    if index < 0 or not strategy or not element:
+        raise ValueError(
+            f'Was not able to parse locator "{locator}". Example usage '
+            f'"id:theID"')
+    return sys.intern(strategy.lower()), element
+
+
+@functools.lru_cache(maxsize=256)
+def _contains_text_locator(text):
+    # pre-parsed locator for any node containing ``text``, so polling for the
+    # same text neither rebuilds nor re-parses the xpath
+    return 'xpath', '//*[contains(., %s)]' % _escape_xpath_value(text)
+
 
 class Base(Driver):
+    __slots__ = ()
 
     def __init__(self, root):
         """
@@ -17,41 +191,9 @@ class Base(Driver):
         """
         super().__init__(root)
         self.log = Logger.get_logger()
-        self._strategies = {
-            'id': self._find_by_id,
-            'name': self._find_by_name,
-            'xpath': self._find_by_xpath,
-            'link': self._find_by_link_text,
-            'partial link': self._find_by_partial_link_text,
-            'css': self._find_by_css_selector,
-            'class': self._find_by_class_name,
-            'tag': self._find_by_tag_name,
-        }
-        self._strategy_alias = {
-            # by identifier
-            'identifier': 'identifier',
-            # by id
-            'id': 'id', 'by id': 'id', 'by_id': 'id', '#': 'id',
-            # by name
-            'name': 'name', 'by name': 'name', 'by_name': 'name',
-            # by xpatch
-            'xpath': 'xpath', 'x': 'xpath', 'x path': 'xpath', 'path': 'xpath',
-            # by dom
-            'dom': 'dom',
-            # by link
-            'link': 'link', '@': 'link', 'link text': 'link',
-            # by partial link
-            'partial': 'partial link', 'partial link': 'partial link',
-            'plink': 'partial link', 'partial_link': 'partial link',
-            # by css
-            'css': 'css', 'css path': 'css', 'css_path': 'css',
-            # by class name
-            'class name': 'class', 'class': 'class', 'class_name': 'class',
-            # by tag
-            'tag': 'tag',
-        }
 
-    def find_element(self, locator, required=True, parent=None, first_only=True) -> WebElement:
+    def find_element(self, locator, required=True, parent=None, first_only=True,
+                     cached=False) -> WebElement:
         """ Main method used to find elements. Will call the right method
         based on the locator provided
 
@@ -74,6 +216,12 @@ class Base(Driver):
                  following the `@` symbol.
                  find_element('@login') === find_element('link:login')
 
+        - A pre-parsed ``(strategy, query)`` tuple skips locator parsing
+          entirely, which helps when the same locator is used in a loop.
+          Selenium's own `By` tuples work too:
+            find_element(('id', 'myId')) === find_element('id:myId')
+            find_element((By.CSS_SELECTOR, 'div.a')) === find_element('css:div.a')
+
         - By default, ``required`` is set to True which will throw a
           NoSuchElementException if the element is not found. Set ``required``
           to False to return None if the element is not found.
@@ -87,32 +235,46 @@ class Base(Driver):
           element. In find_elements, we set ``first_only`` to False return a
           list of elements.
 
+        - Set ``cached`` to True to remember the element found for ``locator``
+          and return it again on later cached calls without a round-trip to
+          the browser. An element is remembered for up to 10 seconds and for
+          the 128 most recently used locators. The cache is cleared on
+          navigation and when switching frames or windows (see
+          `clear_element_cache`). A remembered element
+          that has since been removed from the page raises
+          StaleElementReferenceException when used. The Element helpers
+          (`click_element`, `get_text`, ...) take the same ``cached`` flag and
+          then look such an element up again and retry.
+
         :param locator: str
         :param required: bool - [required] will raise 'ElementNotFound' exception
             if element isn't found. [not required] will return 'None'
         :param parent: WebElement - the driver or parent element
         :param first_only: bool - return all elements or only the first
+        :param cached: bool - reuse the element found by an earlier cached call
         :return WebElement:
         """
-        if parent and not self._is_webelement(parent):
-            raise ValueError(f'Parent must be Selenium WebElement but it '
-                             f'was {type(parent)}.')
-        if self._is_webelement(locator):
-            return locator
-        strategy, query = self._get_strategy(locator)
-        strategy_method = self._strategies[self._strategy_alias[strategy]]
-        elements = strategy_method(query, parent=parent or self.driver)
-        if required and not elements:
-            msg = f'Element with locator "{locator}" not found. it was' \
-                  f' parsed as strategy="{strategy}" and query="{query}"'
-            raise NoSuchElementException(msg)
-        if first_only:
-            if not elements:
-                self.log.info(f'Element with locator "{locator}" not '
-                              f'found. It was parsed as strategy="{strategy}" '
-                              f'and query="{query}"')
+        if isinstance(locator, WebElement):
+            return locator if first_only else [locator]
+        if cached and first_only and parent is None:
+            cache = self._root._element_cache
+            entry = cache.get(locator)
+            now = time.monotonic()
+            if entry is not None and now - entry[1] < _ELEMENT_CACHE_TTL:
+                cache.move_to_end(locator)
+                return entry[0]
+            element = self.find_element(locator, required)
+            if element is None:
+                cache.pop(locator, None)
                 return None
-            return elements[0]
+            cache[locator] = (element, now)
+            cache.move_to_end(locator)
+            if len(cache) > _ELEMENT_CACHE_SIZE:
+                cache.popitem(last=False)
+            return element
+        elements = self._find(locator, required, parent, log_missing=first_only)
+        if first_only:
+            return elements[0] if elements else None
         return elements
 
     def find_elements(self, locator, required=False, parent=None):
@@ -128,19 +290,77 @@ class Base(Driver):
         :param parent: WebElement - the driver or parent element
         :return: List[WebElement]
         """
-        return self.find_element(locator, required, parent, False)
+        if isinstance(locator, WebElement):
+            return [locator]
+        return self._find(locator, required, parent)
 
-    def is_text_present(self, text):
+    def find_first_of(self, locators, required=True, parent=None):
+        """
+        Find an element with the first matching locator out of several
+        alternative ``locators`` for it. Useful when a page serves the same
+        element under different markup.
+
+        The locators are tried in the order given and the element of the
+        first one that matches is returned. When every locator is an xpath or
+        css one (including 'identifier'), they are all tried by a single
+        script in one round-trip; otherwise one query is sent per locator
+        until one matches.
+
+        See `find_element` for ``locator`` usage, ``required`` and ``parent``.
+
+        :param locators: List[str] - alternative locators for the element, in
+            order of preference
+        :param required: bool - [required] will raise 'ElementNotFound' exception
+            if no element is found. [not required] will return 'None'
+        :param parent: WebElement - the driver or parent element
+        :return: WebElement
+        """
+        parsed = [locator if isinstance(locator, (tuple, WebElement))
+                  else _parse_locator(locator) for locator in locators]
+        element = None
+        queries = None
+        if len(parsed) > 1 and (parent is None or self._is_webelement(parent)):
+            queries = self._script_queries(parsed)
+        if queries is not None:
+            element = self.driver.execute_script(_FIRST_OF_SCRIPT, parent,
+                                                 queries)
+        if queries is None or element is False:
+            element = None
+            for locator in parsed:
+                if isinstance(locator, WebElement):
+                    element = locator
+                    break
+                elements = self._find(locator, False, parent)
+                if elements:
+                    element = elements[0]
+                    break
+        if element is not None:
+            return element
+        if required:
+            raise NoSuchElementException(
+                f'None of the locators {locators} matched an element.')
+        self.log.info('None of the locators %s matched an element.', locators)
+        return None
+
+    def is_text_present(self, text, rendered=True):
         """
         See if page to contains `text`. This will not look into the page source
         for text, but will use xpath to find a node that contains the text.
         Use get_source() to find text in the page's source.
 
+        Set ``rendered`` to False to search the raw page source instead. This
+        is a single substring search rather than an xpath scan of every node,
+        which is much faster on large pages, but it also matches markup,
+        attribute values and scripts.
+
         :param text: str
+        :param rendered: bool - False searches the page source
         :return: bool
         """
-        locator = "xpath://*[contains(., %s)]" % self._escape_xpath_value(text)
-        return self.find_element(locator, required=False) is not None
+        if not rendered:
+            return text in self.driver.page_source
+        return self.find_element(_contains_text_locator(text),
+                                 required=False) is not None
 
     def is_enabled(self, locator):
         """
@@ -154,8 +374,7 @@ class Base(Driver):
         element = self.find_element(locator, required=False)
         if element is None:
             return None
-        return (element.is_enabled() and
-                element.get_attribute('readonly') is None)
+        return self.driver.execute_script(_IS_ENABLED_SCRIPT, element)
 
     def is_visible(self, locator):
         """
@@ -175,63 +394,105 @@ class Base(Driver):
         element = self.find_element(locator, required=False)
         return element.is_displayed() if element else None
 
+    def _script_queries(self, parsed):
+        """
+        ``parsed`` locators as the [kind, query] pairs _FIRST_OF_SCRIPT runs,
+        or None if any of them is neither an xpath nor a css query.
+        """
+        queries = []
+        for locator in parsed:
+            if isinstance(locator, WebElement):
+                return None
+            strategy, query = locator
+            target = _STRATEGY_DISPATCH.get(strategy)
+            if target is None:
+                return None
+            by, rewrite_query = target
+            if by == By.XPATH:
+                kind = 'xpath'
+            elif by == By.CSS_SELECTOR:
+                kind = 'css'
+            else:
+                return None
+            queries.append(
+                (kind, query if rewrite_query is None else rewrite_query(query)))
+        return queries
+
+    def _on_element(self, locator, action, cached=False):
+        """
+        Call ``action`` with the element found by ``locator`` and return its
+        result. With ``cached``, the element comes from the element cache (see
+        `find_element`); if it has gone stale it is dropped from the cache,
+        looked up again and ``action`` is retried once.
+        """
+        element = self.find_element(locator, cached=cached)
+        if not cached or element is locator:
+            return action(element)
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            self._root._element_cache.pop(locator, None)
+            return action(self.find_element(locator, cached=True))
+
+    def _find(self, locator, required, parent, log_missing=False):
+        """
+        Core of `find_element` and `find_elements`: parse the string
+        ``locator`` (unless given as a `(strategy, query)` tuple), run the
+        matching strategy and return the list of elements found.
+        """
+        if parent is not None and not self._is_webelement(parent):
+            raise ValueError(f'Parent must be Selenium WebElement but it '
+                             f'was {type(parent)}.')
+        if isinstance(locator, tuple):
+            strategy, query = locator
+        else:
+            strategy, query = self._get_strategy(locator)
+        target = _STRATEGY_DISPATCH.get(strategy)
+        if target is None:
+            raise ValueError(f'Locator strategy "{strategy}" is not supported. '
+                             f'Locator was "{locator}".')
+        by, rewrite_query = target
+        if parent is None:
+            parent = self.driver
+        elements = parent.find_elements(
+            by, query if rewrite_query is None else rewrite_query(query))
+        if not elements:
+            if required:
+                msg = f'Element with locator "{locator}" not found. it was' \
+                      f' parsed as strategy="{strategy}" and query="{query}"'
+                raise NoSuchElementException(msg)
+            if log_missing:
+                self.log.info('Element with locator "%s" not found. It was '
+                              'parsed as strategy="%s" and query="%s"',
+                              locator, strategy, query)
+        return elements
+
+    @contextlib.contextmanager
+    def _no_implicit_wait(self):
+        """
+        Switch the implicit wait (see `Browser.set_implicit_wait`) off while
+        probing for an element that may well be missing, so a miss returns
+        at once instead of after the full wait. Restored on exit.
+        """
+        implicit_wait = self._root.implicit_wait
+        if not implicit_wait:
+            yield
+            return
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(implicit_wait)
+
     def _get_strategy(self, locator):
         """support method used to parse the locator into two string
         'id:element'            returns     'id' and 'element'
         'class name = myClass'  returns     'class name' and 'myClass'
         """
-        if locator.startswith(('/', '(', '.')):
-            return 'xpath', locator
-        if locator.startswith('#'):
-            return 'id', locator[1:]
-        if locator.startswith('@'):
-            return 'link', locator[1:]
-        groups = re.search('^((\w+ )?(\w+)) ?[:=] ?(.+)', locator)
-        # parse locator into "strategy" and "element"
-        # 'class name = spicy' returns 'class name' and 'spicy'
-        if groups is None:
-            raise ValueError(
-                f'Was not able to parse locator "{locator}". Example usage '
-                f'"id:theID"')
-        strategy = groups.group(1)
-        element = groups.group(4)
-        return strategy.lower(), element
+        return _parse_locator(locator)
 
     def _is_webelement(self, element):
         return isinstance(element, WebElement)
 
-    def _find_by_id(self, query, parent):
-        return parent.find_elements(By.ID, query)
-
-    def _find_by_name(self, query, parent):
-        return parent.find_elements(By.NAME, query)
-
-    def _find_by_xpath(self, query, parent):
-        return parent.find_elements(By.XPATH, query)
-
-    def _find_by_link_text(self, query, parent):
-        return parent.find_elements(By.LINK_TEXT, query)
-
-    def _find_by_partial_link_text(self, query, parent):
-        return parent.find_elements(By.PARTIAL_LINK_TEXT, query)
-
-    def _find_by_css_selector(self, query, parent):
-        return parent.find_elements(By.CSS_SELECTOR, query)
-
-    def _find_by_class_name(self, query, parent):
-        return parent.find_elements(By.CLASS_NAME, query)
-
-    def _find_by_tag_name(self, query, parent):
-        return parent.find_elements(By.TAG_NAME, query)
-
     def _escape_xpath_value(self, value):
-        # https://stackoverflow.com/questions/14822153/escape-single-quote-in-xpath-with-nokogiri
-        # if you wanted to match the string: "That's mine", he said.,
-        # you would need to do something like:
-        #   text()=concat('"That', "'", 's mine", he said.')
-        if '"' in value and '\'' in value:
-            parts_wo_apos = value.split('\'')
-            return f"concat('%s')" % "', \"'\", '".join(parts_wo_apos)
-        if '\'' in value:
-            return f"\"{value}\""
-        return f"'{value}'"
+        return _escape_xpath_value(value)
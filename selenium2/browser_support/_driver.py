@@ -9,6 +9,9 @@ class Driver:
     self._root.driver which is Browser.driver.
     """
 
+    # every mixin is created once per Browser; slots keep them dict-free
+    __slots__ = ('_root', 'log')
+
     def __init__(self, root):
         """
         The root class which holds the global browser driver.
@@ -27,3 +30,11 @@ class Driver:
         """
         driver: WebDriver = self._root.driver
         return driver
+
+    def clear_element_cache(self):
+        """
+        Forget every element remembered by `find_element(cached=True)`.
+        Called on navigation and when switching frames or windows; call it
+        yourself when the page changes through a click or a script.
+        """
+        self._root._element_cache.clear()
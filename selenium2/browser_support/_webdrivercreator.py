@@ -1,10 +1,133 @@
+import atexit
+import functools
+import os
+import threading
+import weakref
+from types import MappingProxyType, MethodType
+
+try:
+    import fcntl
+except ImportError:  # windows
+    fcntl = None
+    import msvcrt
+
 from selenium import webdriver
 from selenium.webdriver import ChromeOptions, FirefoxOptions, FirefoxProfile
 from selenium.webdriver.safari.options import Options as SafariOptions
+from selenium.common.exceptions import WebDriverException
 
+from ..config import DRIVER_POOL_SIZE, PROFILE_ROOT_DIRECTORY
 from ..logger import Logger
 
 
+# canonical browser name -> every accepted spelling of it
+_BROWSER_SPELLINGS = {
+    # chrome
+    'chrome': ['googlechrome', 'gc', 'chrome', 'google'],
+    # ninja chrome - anti robot detection browser in chrome
+    'chrome_ninja': [d.join(pair)
+                     for d in (' ', '-', '_',)
+                     for kw in ('ninja', 'incognito', 'private')
+                     for pair in ((kw, 'chrome',), ('chrome', kw))],
+    # headless chrome
+    'headless_chrome': ['headlesschrome', 'chromeheadless',
+                        'headless_chrome', 'headless chrome'],
+    # firefox
+    'firefox': ['ff', 'firefox'],
+    # ninja ff - anti robot detection browser in firefox
+    'firefox_ninja': [d.join(pair)
+                      for d in (' ', '-', '_',)
+                      for kw in ('ninja', 'incognito', 'private')
+                      for ff in ('ff', 'firefox')
+                      for pair in ((kw, ff,), (ff, kw))],
+    # headless firefox
+    'headless_firefox': ['headlessfirefox', 'firefoxheadless',
+                         'headless firefox', 'headless_firefox'],
+    # internet explorer
+    'ie': ['ie', 'ei', 'internetexplorer', 'explorer'],
+    # edge
+    'edge': ['edge'],
+    'safari': ['safari'],
+
+    # TODO: add other browsers
+    # 'opera' : 'opera',
+    # 'phantomjs' : 'phantomjs',
+    # 'htmlunit' : 'htmlunit',
+    # 'htmlunitwithjs' : 'htmlunit_with_js',
+    # 'android' : 'android',
+    # 'iphone' : 'iphone'
+}
+
+_BROWSER_NAMES = tuple(_BROWSER_SPELLINGS)
+
+# every accepted spelling -> canonical browser name, built once at import so
+# browser_name is a single lookup
+_BROWSER_ALIASES = MappingProxyType({
+    alias: name
+    for name, aliases in _BROWSER_SPELLINGS.items()
+    for alias in aliases
+})
+
+# browsers started on the persistent profile under SELENIUM2_PROFILE_PATH
+# -> profile family (directory name) they share
+_PROFILE_FAMILIES = MappingProxyType({
+    'chrome': 'chrome', 'headless_chrome': 'chrome',
+    'firefox': 'firefox', 'headless_firefox': 'firefox',
+})
+
+# registered by chrome ninja to run before any page script
+_HIDE_WEBDRIVER_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    })
+"""
+
+# run in every window of a pooled driver before handing it to the next
+# session; pages without storage (data:, about:blank) throw on access
+_RESET_STORAGE_SCRIPT = """
+    try {
+        window.localStorage.clear();
+        window.sessionStorage.clear();
+    } catch (e) {}
+"""
+
+
+def _lock_file(path):
+    """
+    Open ``path`` and take an exclusive lock on it without waiting. The lock
+    is tied to the open file, so it is also dropped if the process dies.
+    :return: the locked file descriptor, or None if the lock is held by
+        another process or another driver of this one
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _unlock_file(fd):
+    if fcntl is None:
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    os.close(fd)
+
+
+@functools.lru_cache(maxsize=32)
+def _canonical_browser(browser):
+    # memoized as the same one or two browser strings are resolved for every
+    # driver a run creates
+    name = _BROWSER_ALIASES.get(browser.lower())
+    if name is None:
+        raise ValueError(f'`{browser}` is not a supported browser yet.\n'
+                         f'Available: {_BROWSER_NAMES}')
+    return name
+
+
 class WebDriverCreator:
     """
     Solely responsible for creating a web driver for the specified browser with
@@ -15,52 +138,20 @@ class WebDriverCreator:
             )
     """
 
+    # idle drivers by (browser, ip), shared by every creator so a new Browser
+    # can pick up the session an earlier one released (see release_driver)
+    _pool = {}
+    _pool_keys = weakref.WeakKeyDictionary()
+    _pool_lock = threading.Lock()
+    # driver -> finalizer releasing the lock on the persistent profile it runs
+    # on, called by release_driver or when the driver is garbage collected
+    _profile_locks = weakref.WeakKeyDictionary()
+
     def __init__(self):
         self.log = Logger.get_logger()
 
     def browser_name(self, browser):
-        mapper = {
-            # chrome
-            'chrome': ['googlechrome', 'gc', 'chrome', 'google'],
-            # ninja chrome - anti robot detection browser in chrome
-            'chrome_ninja': [d.join(pair)
-                             for d in (' ', '-', '_',)
-                             for kw in ('ninja', 'incognito', 'private')
-                             for pair in ((kw, 'chrome',), ('chrome', kw))],
-            # headless chrome
-            'headless_chrome': ['headlesschrome', 'chromeheadless',
-                                'headless_chrome', 'headless chrome'],
-            # firefox
-            'firefox': ['ff', 'firefox'],
-            # ninja ff - anti robot detection browser in firefox
-            'firefox_ninja': [d.join(pair)
-                              for d in (' ', '-', '_',)
-                              for kw in ('ninja', 'incognito', 'private')
-                              for ff in ('ff', 'firefox')
-                              for pair in ((kw, ff,), (ff, kw))],
-            # headless firefox
-            'headless_firefox': ['headlessfirefox', 'firefoxheadless',
-                                 'headless firefox', 'headless_firefox'],
-            # internet explorer
-            'ie': ['ie', 'ei', 'internetexplorer', 'explorer'],
-            # edge
-            'edge': ['edge'],
-            'safari': ['safari'],
-
-            # TODO: add other browsers
-            # 'opera' : 'opera',
-            # 'phantomjs' : 'phantomjs',
-            # 'htmlunit' : 'htmlunit',
-            # 'htmlunitwithjs' : 'htmlunit_with_js',
-            # 'android' : 'android',
-            # 'iphone' : 'iphone'
-        }
-        for key, value in mapper.items():
-            if browser in value:
-                return key
-
-        raise ValueError(f'`{browser}` is not a supported browser yet.\n'
-                         f'Available: {mapper.keys()}')
+        return _canonical_browser(browser)
 
     def create_driver(self, browser, profile=None, options=None, ip=None):
         """
@@ -72,9 +163,170 @@ class WebDriverCreator:
             such as webdriver.FirefoxOptions()
         :param ip: A string representing the ip address and port number
         :return: browser controlling driver
+
+        When SELENIUM2_DRIVER_POOL_SIZE is set, a driver released earlier for
+        the same browser and ip is reused instead of launching a new one, as
+        long as its browser is still alive. Drivers with a custom ``profile``
+        or ``options`` are never pooled.
         """
+        name = _canonical_browser(browser)
+        key = None
+        if DRIVER_POOL_SIZE and profile is None and options is None:
+            key = (name, ip)
+            driver = self._take_pooled_driver(key)
+            if driver is not None:
+                self.log.info('Reusing pooled %s driver with session id %s.',
+                              key[0], driver.session_id)
+                self._pool_keys[driver] = key
+                return driver
+        lock = None
+        if PROFILE_ROOT_DIRECTORY and profile is None and options is None:
+            lock, options = self._persistent_profile_options(name)
         creation_method = self.get_creation_method(browser)
-        return creation_method(profile, options, ip)
+        try:
+            driver = creation_method(profile, options, ip)
+        except BaseException:
+            if lock is not None:
+                _unlock_file(lock)
+            raise
+        if key is not None:
+            self._pool_keys[driver] = key
+        if lock is not None:
+            self._profile_locks[driver] = weakref.finalize(
+                driver, _unlock_file, lock)
+        return driver
+
+    @classmethod
+    def _take_pooled_driver(cls, key):
+        """
+        Pop an idle driver pooled under ``key`` whose browser still answers,
+        quitting any that has died (crashed or closed from outside) on the way.
+        :return: WebDriver or None if no live driver is pooled
+        """
+        while True:
+            with cls._pool_lock:
+                idle = cls._pool.get(key)
+                if not idle:
+                    return None
+                driver = idle.pop()
+            try:
+                driver.window_handles
+            except WebDriverException:
+                cls._discard_driver(driver)
+            else:
+                return driver
+
+    def _persistent_profile_options(self, name):
+        """
+        Options starting browser ``name`` on its persistent profile directory
+        under SELENIUM2_PROFILE_PATH, so its http cache and compiled scripts
+        survive between sessions. Browsers refuse to share a profile between
+        two live sessions, so the directory is guarded by a ``<family>.lock``
+        file next to it. While another driver, of this or any other process,
+        holds the lock (or for browsers without a profile family) returns
+        (None, None) and a throwaway profile is used as before.
+        :return: tuple of the locked lock file descriptor and the options
+        """
+        family = _PROFILE_FAMILIES.get(name)
+        if family is None:
+            return None, None
+        root = os.path.abspath(PROFILE_ROOT_DIRECTORY)
+        os.makedirs(root, exist_ok=True)
+        lock = _lock_file(os.path.join(root, family + '.lock'))
+        if lock is None:
+            self.log.info('Persistent %s profile is in use, starting %s with '
+                          'a temporary profile.', family, name)
+            return None, None
+        path = os.path.join(root, family)
+        os.makedirs(path, exist_ok=True)
+        if family == 'chrome':
+            options = ChromeOptions()
+            options.add_argument(f'--user-data-dir={path}')
+        else:
+            # used in place, unlike a FirefoxProfile which is copied per session
+            options = FirefoxOptions()
+            options.add_argument('-profile')
+            options.add_argument(path)
+        return lock, options
+
+    @classmethod
+    def release_driver(cls, driver):
+        """
+        Hand back a driver that is no longer needed. A driver created while
+        pooling is enabled is reset (see `_reset_driver`) and kept for the
+        next `create_driver` call with the same browser and ip. Any other
+        driver, one that could not be fully reset or one the pool has no room
+        for, is quit.
+        :param driver: WebDriver returned by `create_driver`
+        """
+        with cls._pool_lock:
+            if any(pooled is driver for idle in cls._pool.values()
+                   for pooled in idle):
+                return  # released twice, it is already idle in the pool
+        key = cls._pool_keys.pop(driver, None)
+        if key is not None and not cls._reset_driver(driver):
+            key = None
+        if key is not None:
+            with cls._pool_lock:
+                idle = cls._pool.setdefault(key, [])
+                if len(idle) < DRIVER_POOL_SIZE:
+                    idle.append(driver)
+                    return
+        unlock = cls._profile_locks.pop(driver, None)
+        try:
+            driver.quit()
+        finally:
+            if unlock is not None:
+                unlock()
+
+    @staticmethod
+    def _reset_driver(driver):
+        """
+        Clear what a session leaves behind on ``driver`` before it is pooled:
+        the implicit wait goes back to 0, every window but the first is
+        closed after its local and session storage are cleared, cookies of
+        every domain are deleted and the remaining window shows a blank page.
+        Only Chromium drivers can delete the cookies of all domains (through
+        the DevTools protocol), so any other driver is left as is.
+        :return: bool - True if the driver was reset and can be pooled
+        """
+        if not hasattr(driver, 'execute_cdp_cmd'):
+            return False
+        try:
+            driver.implicitly_wait(0)
+            handles = driver.window_handles
+            for handle in reversed(handles):
+                driver.switch_to.window(handle)
+                driver.execute_script(_RESET_STORAGE_SCRIPT)
+                if handle != handles[0]:
+                    driver.close()
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            driver.get('about:blank')
+        except WebDriverException:
+            return False
+        return True
+
+    @classmethod
+    def close_pool(cls):
+        """ Quit every idle pooled driver. Registered to run at exit. """
+        with cls._pool_lock:
+            idle = [driver for drivers in cls._pool.values() for driver in drivers]
+            cls._pool.clear()
+        for driver in idle:
+            cls._discard_driver(driver)
+
+    @classmethod
+    def _discard_driver(cls, driver):
+        # quit a pooled driver that is no longer wanted, whatever state its
+        # browser is in, and free the persistent profile it may hold
+        unlock = cls._profile_locks.pop(driver, None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        finally:
+            if unlock is not None:
+                unlock()
 
     def get_creation_method(self, browser):
         """
@@ -82,7 +334,21 @@ class WebDriverCreator:
         :param browser: A string representing the desired browser
         :return: driver creation method
         """
-        return getattr(self, f'create_{self.browser_name(browser.lower())}')
+        creator = self._CREATORS[_canonical_browser(browser)]
+        return MethodType(creator, self)
+
+    @staticmethod
+    def _prepare_options(options, options_class, ip):
+        """
+        Shared set up of the ``options`` every creation method receives: a
+        fresh ``options_class`` instance when none was given and the proxy
+        server when an ``ip`` was given.
+        """
+        if not options:
+            options = options_class()
+        if ip:
+            options.add_argument(f'--proxy-server={ip}')
+        return options
 
     ############################################################################
     # browser specific creation methods
@@ -91,32 +357,24 @@ class WebDriverCreator:
         if profile is not None:
             self.log.warning('Chrome was instantiated with a profile which is a '
                              'firefox exclusive parameter.')
-        if not options:
-            options = ChromeOptions()
-        if ip:
-            options.add_argument(f'--proxy-server={ip}')
+        options = self._prepare_options(options, ChromeOptions, ip)
         return webdriver.Chrome(options=options)
 
-    def create_chrome_ninja(self, profile, options, ip):
+    def create_chrome_ninja(self, profile, options, ip, user_agent='browser1'):
         """
         Recommended to edit chromedriver.exe by replacing all 'cdc_' text to
         'dog_' or anything else.
+        :param user_agent: User-Agent the browser reports, set on the command
+            line so it applies from the very first request
         """
         if not options:
             options = ChromeOptions()
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
+        options.add_argument(f'--user-agent={user_agent}')
         driver = self.create_chrome(profile, options, ip)
-        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-            "source": """
-                      Object.defineProperty(navigator, 'webdriver', {
-                      get: () => undefined
-                      })
-                   """
-        })
-        driver.execute_cdp_cmd("Network.enable", {})
-        driver.execute_cdp_cmd("Network.setExtraHTTPHeaders",
-                               {"headers": {"User-Agent": "browser1"}})
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                               {"source": _HIDE_WEBDRIVER_SCRIPT})
         return driver
 
     def create_headless_chrome(self, profile, options, ip):
@@ -126,31 +384,24 @@ class WebDriverCreator:
         return self.create_chrome(profile, options, ip)
 
     def create_firefox(self, profile, options, ip):
-        if not options:
-            options = FirefoxOptions()
+        options = self._prepare_options(options, FirefoxOptions, ip)
         if profile:
             profile_instance = FirefoxProfile(profile) if isinstance(profile, str) else profile
             options.profile = profile_instance
-        if ip is not None:
-            options.add_argument(f'--proxy-server={ip}')
         return webdriver.Firefox(options=options)
 
     def create_firefox_ninja(self, profile, options, ip):
         """
-        Sets up a 'ninja' profile for Firefox to avoid detection.
+        Sets up 'ninja' preferences for Firefox to avoid detection.
         """
         if profile is not None:
             self.log.warning('Firefox ninja received a `profile` which will be '
-                             'ignored and replaced by `ninja profile`.')
-        if not options:
-            options = webdriver.FirefoxOptions()
-        ninja_profile = FirefoxProfile()
-        ninja_profile.set_preference("dom.webdriver.enabled", False)
-        ninja_profile.set_preference("useAutomationExtension", False)
-        ninja_profile.update_preferences()
-        options.profile = ninja_profile
-        if ip:
-            options.add_argument(f'--proxy-server={ip}')
+                             'ignored in favour of the ninja preferences.')
+        options = self._prepare_options(options, FirefoxOptions, ip)
+        # set on the options rather than a FirefoxProfile, which is copied
+        # and zipped to geckodriver on every launch
+        options.set_preference("dom.webdriver.enabled", False)
+        options.set_preference("useAutomationExtension", False)
         return webdriver.Firefox(options=options)
 
     def create_headless_firefox(self, profile, options, ip):
@@ -168,10 +419,7 @@ class WebDriverCreator:
         """
         if profile is not None:
             self.log.warning('IE was instantiated with a profile which is a Firefox exclusive parameter.')
-        if not options:
-            options = webdriver.IeOptions()
-        if ip:
-            options.add_argument(f'--proxy-server={ip}')
+        options = self._prepare_options(options, webdriver.IeOptions, ip)
         return webdriver.Ie(options=options)
 
     def create_edge(self, profile, options, ip):
@@ -180,18 +428,29 @@ class WebDriverCreator:
         """
         if profile is not None:
             self.log.warning('Edge was instantiated with a profile which is not applicable.')
-        if not options:
-            options = webdriver.EdgeOptions()
-        if ip:
-            options.add_argument(f'--proxy-server={ip}')
+        options = self._prepare_options(options, webdriver.EdgeOptions, ip)
         return webdriver.Edge(options=options)
 
     def create_safari(self, profile, options, ip):
         """
         Creates a Safari browser instance.
         """
-        if not options:
-            options = SafariOptions()
-        if ip:
-            options.add_argument(f'--proxy-server={ip}')
-        return webdriver.Safari(options=options)
\ No newline at end of file
+        options = self._prepare_options(options, SafariOptions, ip)
+        return webdriver.Safari(options=options)
+
+    # canonical browser name (see browser_name) -> creation method, built once
+    # with the class instead of looking up `create_<name>` on every call
+    _CREATORS = {
+        'chrome': create_chrome,
+        'chrome_ninja': create_chrome_ninja,
+        'headless_chrome': create_headless_chrome,
+        'firefox': create_firefox,
+        'firefox_ninja': create_firefox_ninja,
+        'headless_firefox': create_headless_firefox,
+        'ie': create_ie,
+        'edge': create_edge,
+        'safari': create_safari,
+    }
+
+
+atexit.register(WebDriverCreator.close_pool)
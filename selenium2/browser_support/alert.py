@@ -1,3 +1,6 @@
+import logging
+from types import MappingProxyType
+
 from selenium.common.exceptions import TimeoutException, NoAlertPresentException
 from selenium.webdriver.support.expected_conditions import alert_is_present
 from selenium.webdriver.support.ui import WebDriverWait
@@ -6,8 +9,23 @@ from ..config import *
 from ..logger import Logger
 from ._driver import Driver
 
+# accepted (upper case) action -> Alert method performing it, None to leave
+# the alert open
+_ALERT_ACTIONS = MappingProxyType({
+    'ACCEPT': 'accept', 'OK': 'accept', 'ACK': 'accept',
+    'CANCEL': 'dismiss', 'DISMISS': 'dismiss', 'CLOSE': 'dismiss',
+    'IGNORE': None, 'NONE': None, 'LEAVE': None,
+})
+_MISSING = object()
+
+# stateless, so one condition serves every wait
+_ALERT_IS_PRESENT = alert_is_present()
+# seconds between polls while waiting for an alert (selenium's default is 0.5)
+_ALERT_POLL_FREQUENCY = 0.1
+
 
 class Alert(Driver):
+    __slots__ = ()
     _next_alert_action = 'accept'
 
     def __init__(self, root):
@@ -25,10 +43,19 @@ class Alert(Driver):
         :param message: str - error message to return in case of failure
         :return: alert selenium.webdriver.common.alert import Alert
         """
-        self.log.info(message.format(timeout))
+        # ``message`` is a str.format template, only worth filling if logged
+        if self.log.isEnabledFor(logging.INFO):
+            self.log.info(message.format(timeout))
+        driver = self.driver
         try:
-            alert = WebDriverWait(self.driver, timeout).until(alert_is_present())
-            return alert
+            # an alert already showing is returned without starting a wait
+            return driver.switch_to.alert
+        except NoAlertPresentException:
+            pass
+        try:
+            return WebDriverWait(driver, timeout,
+                                 poll_frequency=_ALERT_POLL_FREQUENCY
+                                 ).until(_ALERT_IS_PRESENT)
         except TimeoutException as error:
             error.msg = (f'Failed to find the alert before the timeout '
                          f' [{timeout} second(s)].')
@@ -74,22 +101,27 @@ class Alert(Driver):
                        'of {} seconds' % (text, action.lower()))
         alert = self.get_alert(timeout, message=log_message)
         alert.send_keys(text)
-        self._handle_alert(alert, action)
+        self._handle_alert(alert, action, want_text=False)
 
-    def _handle_alert(self, alert, action):
+    def _handle_alert(self, alert, action, want_text=True):
         """
         See handle_alert() for details
         :param alert: selenium.webdriver.common.alert import Alert
         :param action: str - accept / dismiss / leave
-        :return: str - the text value of the alert
+        :param want_text: bool - False skips fetching the alert's text
+        :return: str - the text value of the alert (None if not wanted)
         """
-        actn = action.upper()
-        text = ' '.join(alert.text.splitlines())
-        if actn == 'ACCEPT' or actn == 'OK' or actn == 'ACK':
-            alert.accept()
-        elif actn == 'CANCEL' or actn == 'DISMISS' or actn == 'CLOSE':
-            alert.dismiss()
-        elif not (actn == 'IGNORE' or actn == 'NONE' or actn == 'LEAVE'):
+        method = _ALERT_ACTIONS.get(action.upper(), _MISSING)
+        if method is _MISSING:
             raise ValueError('Invalid alert action: {}.'.format(action))
+        text = None
+        if want_text:
+            text = alert.text
+            # every line break is non printable, single line alerts skip
+            # the split and join
+            if not text.isprintable():
+                text = ' '.join(text.splitlines())
+        if method is not None:
+            getattr(alert, method)()
         return text
 
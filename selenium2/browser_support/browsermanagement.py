@@ -2,9 +2,13 @@ import re
 
 from ..logger import Logger
 from ._driver import Driver
+from ._webdrivercreator import WebDriverCreator
+
+_URL_SCHEME_RE = re.compile(r'https?://|file:///')
 
 
 class BrowserManagement(Driver):
+    __slots__ = ()
 
     def __init__(self, root):
         super().__init__(root)
@@ -12,10 +16,12 @@ class BrowserManagement(Driver):
 
     def back(self):
         """ Simulates a back button click """
+        self.clear_element_cache()
         self.driver.back()
 
     def forward(self):
         """ Simulates a forward button click """
+        self.clear_element_cache()
         self.driver.forward()
 
     def get_session_id(self):
@@ -37,17 +43,27 @@ class BrowserManagement(Driver):
     def goto(self, url):
         """Navigates the active browser instance to the provided url.
         Will append default prefix to the url if it's missing"""
-        if not re.search(r'^(https?://|file:///)', url):
+        if not _URL_SCHEME_RE.match(url):
             url = 'https://' + url
-        self.log.info("Opening url '%s'" % url)
+        self.log.info("Opening url '%s'", url)
+        self.clear_element_cache()
         self.driver.get(url)
 
     def quit(self):
-        """ Close the browser, effectively ending the session """
-        self.log.info('Closing session with session id {}.'
-                      .format(self.driver.session_id))
-        self.driver.quit()
+        """ Close the browser, effectively ending the session. With driver
+        pooling enabled (SELENIUM2_DRIVER_POOL_SIZE), the session is reset
+        and kept for the next Browser instead. The Browser lets go of its
+        driver either way, so calling quit again does nothing. """
+        driver = self.driver
+        if driver is None:
+            return
+        self.log.info('Closing session with session id %s.', driver.session_id)
+        self.clear_element_cache()
+        # detached first: once pooled, the driver belongs to the next Browser
+        self._root.driver = None
+        WebDriverCreator.release_driver(driver)
 
     def refresh(self):
         """ Refreshes current page """
+        self.clear_element_cache()
         self.driver.refresh()
\ No newline at end of file
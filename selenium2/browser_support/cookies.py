@@ -5,7 +5,26 @@ from ..logger import Logger
 from ._base import Base
 
 
+def _cdp_cookie(cookie):
+    # WebDriver cookie dict -> CDP Network.CookieParam. Host-only cookies
+    # (domain without a leading dot) are given as an url to stay host-only
+    param = {key: cookie[key] for key in ('name', 'value', 'path', 'secure',
+                                          'httpOnly') if key in cookie}
+    domain = cookie['domain']
+    if domain.startswith('.'):
+        param['domain'] = domain
+    else:
+        scheme = 'https' if cookie.get('secure') else 'http'
+        param['url'] = f"{scheme}://{domain}{cookie.get('path', '/')}"
+    if 'expiry' in cookie:
+        param['expires'] = cookie['expiry']
+    if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+        param['sameSite'] = cookie['sameSite']
+    return param
+
+
 class Cookies(Base):
+    __slots__ = ()
 
     def __init__(self, root):
         super().__init__(root)
@@ -87,9 +106,8 @@ class Cookies(Base):
             raise RuntimeError("Failed to load file '%s'. File not found. "
                                "Full path used: %s" % (filename, path) )
         for cookie in cookies:
-            if 'expiry' in cookie:
-                del cookie['expiry']
-            self.driver.add_cookie(cookie)
+            cookie.pop('expiry', None)
+        self._add_cookies(cookies)
 
     def save_cookies(self, filename):
         """
@@ -112,9 +130,11 @@ class Cookies(Base):
         self._create_directory(path)
         cookies = self.driver.get_cookies()
         with open(path, 'w') as filehandle:
-            # store the cookies as binary data stream
-            json.dump(cookies, filehandle, indent=2, default=str)
-        self.log.info('Saving cookies to {}'.format(path))
+            # one compact string from the C encoder; json.dump and indent both
+            # fall back to writing many small chunks from the python encoder
+            filehandle.write(json.dumps(cookies, separators=(',', ':'),
+                                        default=str))
+        self.log.info('Saving cookies to %s', path)
         return path
 
     def set_cookies_directory(self, path=None, append=True):
@@ -134,15 +154,14 @@ class Cookies(Base):
         :param append: bool - True will add / False will replace
         :return: str - previous path
         """
-        if path is not None:
-            path = os.path.normpath(os.path.join(self._root.cookie_directory, path)) \
-                if append else path
-            self._create_directory(path)
+        if path is not None and append:
+            path = os.path.join(self._root.cookie_directory, path)
         previous = self._root.cookie_directory
+        # abspath also normalises, so a single pass replaces normpath + abspath
         path = os.path.abspath(path)
-        self.log.info('Setting cookies directory from {} to {}'.format(
-            previous, path
-        ))
+        self._create_directory(path)
+        self.log.info('Setting cookies directory from %s to %s',
+                      previous, path)
         self._root.cookie_directory = path
         return previous
 
@@ -161,15 +180,26 @@ class Cookies(Base):
         self.driver.delete_all_cookies()
         for cookie in cookies:
             cookie['expiry'] = date
-            self.driver.add_cookie(cookie)
+        self._add_cookies(cookies)
+
+    def _add_cookies(self, cookies):
+        # chromium takes every cookie in one Network.setCookies call instead of
+        # a WebDriver round-trip per cookie; other browsers add them one by one
+        driver = self.driver
+        if hasattr(driver, 'execute_cdp_cmd') \
+                and all('domain' in cookie for cookie in cookies):
+            driver.execute_cdp_cmd('Network.setCookies', {
+                'cookies': [_cdp_cookie(cookie) for cookie in cookies]})
+            return
+        for cookie in cookies:
+            driver.add_cookie(cookie)
 
     def _create_directory(self, path):
         target_dir = os.path.dirname(path)
         if not os.path.exists(target_dir):
-            self.log.info('Creating new directory to store cookies at {}'.format(
-                target_dir
-            ))
-            os.makedirs(target_dir)
+            self.log.info('Creating new directory to store cookies at %s',
+                          target_dir)
+            os.makedirs(target_dir, exist_ok=True)
 
     def _get_cookies_path(self, filename):
         directory = self._root.cookie_directory
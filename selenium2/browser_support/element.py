@@ -5,26 +5,175 @@ from selenium.webdriver.common.keys import Keys
 from ..logger import Logger
 from ._base import Base
 
+Key = namedtuple('Key', 'original, key_code')
+
+# special key name -> the code selenium sends for it, read once instead of a
+# hasattr + getattr on Keys for every key sent
+_SELENIUM_KEYS = {name: getattr(Keys, name) for name in dir(Keys)
+                  if not name.startswith('_')}
+
+# whether the page or any of its (nested) frames contains arguments[0], in the
+# same sense as is_text_present; null when a cross-origin frame could not be read
+_PAGE_CONTAINS_TEXT_SCRIPT = """
+    var text = arguments[0];
+    var blocked = false;
+    function scan(win) {
+        try {
+            var root = win.document.documentElement;
+            if (root && root.textContent.indexOf(text) !== -1) {
+                return true;
+            }
+        } catch (e) {
+            blocked = true;
+            return false;
+        }
+        for (var i = 0; i < win.frames.length; i++) {
+            if (scan(win.frames[i])) {
+                return true;
+            }
+        }
+        return false;
+    }
+    return scan(window) || (blocked ? null : false);
+"""
+
+# fires the event named arguments[1] on element arguments[0]
+_SIMULATE_EVENT_SCRIPT = """
+    var element = arguments[0];
+    var eventName = arguments[1];
+    if (document.createEventObject) { // IE
+        return element.fireEvent(eventName, document.createEventObject());
+    }
+    var evt = document.createEvent("HTMLEvents");
+    evt.initEvent(eventName, true, true);
+    return !element.dispatchEvent(evt);
+"""
+
+# covers each element of arguments[0] with a blue div
+_HIGHLIGHT_SCRIPT = """
+    for (var i = 0; i < arguments[0].length; i++) {
+        var old_element = arguments[0][i];
+        var newDiv = document.createElement('div');
+        newDiv.setAttribute("name", "covered");
+        newDiv.style.backgroundColor = 'blue';
+        newDiv.style.zIndex = '999';
+        newDiv.style.top = old_element.offsetTop + 'px';
+        newDiv.style.left = old_element.offsetLeft + 'px';
+        newDiv.style.height = old_element.offsetHeight + 'px';
+        newDiv.style.width = old_element.offsetWidth + 'px';
+        old_element.parentNode.insertBefore(newDiv, old_element);
+        old_element.parentNode.removeChild(old_element);
+        newDiv.parentNode.style.overflow = 'hidden';
+    }
+"""
+
 
 class Element(Base):
+    __slots__ = ()
 
     def __init__(self, root):
         super().__init__(root)
         self.log = Logger.get_logger()
 
-    def clear_element_text(self, locator):
+    def bulk_actions(self, actions):
+        """
+        Perform a sequence of clicks and typing, in order, with a single
+        action chain, such as when filling a form: one round-trip performs
+        every step instead of one per step. Each step is a dict:
+
+            {'type': 'click', 'locator': locator}
+            {'type': 'type', 'locator': locator, 'text': str or List[str]}
+
+        ``text`` is sent as with `send_keys`: special key names ('ENTER',
+        'TAB', 'CTRL', ...) are sent as those keys and, in a list of several
+        keys, special keys are held down as modifiers for the rest. The
+        element is clicked before its text is typed.
+
+        Example:
+        _.bulk_actions([
+            {'type': 'click', 'locator': '#title-mrs'},
+            {'type': 'type', 'locator': '#first-name', 'text': 'Ada'},
+            {'type': 'type', 'locator': '#last-name', 'text': 'Lovelace'},
+            {'type': 'click', 'locator': '#accept-terms'},
+            {'type': 'type', 'locator': '#last-name', 'text': 'ENTER'},
+        ])
+
+        See `find_element` method in `_base.py` for ``locator`` usage/syntax
+
+        :param actions: List[Dict[str, Any]] - the steps, in order
+        :return: NoReturn
+        """
+        actions = list(actions)
+        self.log.info('Performing %s action(s) in one action chain.',
+                      len(actions))
+        chain = ActionChains(self.driver)
+        for action in actions:
+            kind = action['type']
+            if kind not in ('click', 'type'):
+                raise ValueError(f'Bulk action type "{kind}" is not supported. '
+                                 f'Use "click" or "type".')
+            element = self.find_element(action['locator'])
+            if kind == 'click':
+                chain.click(element)
+            else:
+                text = action['text']
+                keys = (text,) if isinstance(text, str) else tuple(text)
+                self._queue_keys(chain, element, self._parse_keys(*keys))
+        if actions:
+            chain.perform()
+
+    def bulk_click(self, *locators):
+        """
+        Click every element identified by ``locators``, in order, with a single
+        action chain. See `bulk_actions` to mix clicks and typing.
+
+        Example:
+        _.bulk_click('#accept-terms', '#newsletter', 'css:button[type=submit]')
+
+        See `find_element` method in `_base.py` for ``locator`` usage/syntax
+
+        :param locators: WebElement or str
+        :return: NoReturn
+        """
+        self.bulk_actions({'type': 'click', 'locator': locator}
+                          for locator in locators)
+
+    def bulk_send_keys(self, fields):
+        """
+        Type text into several elements with a single action chain. Text is
+        sent as with `send_keys`, so special key names such as 'ENTER' are
+        sent as those keys. See `bulk_actions` to mix clicks and typing.
+
+        Example:
+        _.bulk_send_keys({'#first-name': 'Ada', '#last-name': 'Lovelace'})
+
+        See `find_element` method in `_base.py` for ``locator`` usage/syntax
+
+        :param fields: Dict[locator, str] or List[Tuple[locator, str]] - the
+            text to type into each element, in order; use the list form to
+            type into the same element more than once
+        :return: NoReturn
+        """
+        # a list of pairs keeps its order and any repeated locator
+        fields = fields.items() if isinstance(fields, dict) else fields
+        self.bulk_actions({'type': 'type', 'locator': locator, 'text': text}
+                          for locator, text in fields)
+
+    def clear_element_text(self, locator, cached=False):
         """
         Clears the value of text entry element identified by locator.
 
         See `find_element` method in `_base.py` for ``locator`` usage/syntax
 
         :param locator: WebEelement or str
+        :param cached: bool - reuse the element of an earlier cached lookup
+            (see `find_element`)
         :return: NoReturn
         """
-        self.log.info(f'Cleared text at {locator}.')
-        self.find_element(locator).clear()
+        self.log.info('Cleared text at %s.', locator)
+        self._on_element(locator, lambda element: element.clear(), cached)
 
-    def click_element(self, locator):
+    def click_element(self, locator, cached=False):
         """
         Click element identified by locator. Will automatically append
         the correct tag to help pinpoint the element.
@@ -32,10 +181,12 @@ class Element(Base):
         See `find_element` method in `_base.py` for ``locator`` usage/syntax
 
         :param locator: WebEelement or str
+        :param cached: bool - reuse the element of an earlier cached lookup
+            (see `find_element`)
         :return: NoReturn
         """
-        self.log.info(f'Clicking element {locator}.')
-        self.find_element(locator).click()
+        self.log.info('Clicking element %s.', locator)
+        self._on_element(locator, lambda element: element.click(), cached)
 
     def click_element_at_coordinates(self, locator, xoffset, yoffset):
         """
@@ -49,8 +200,8 @@ class Element(Base):
         :param yoffset: Y offset to move to, as a positive or negative integer.
         :return:
         """
-        self.log.info(f'Clicking element {locator} at coordinates x={xoffset}, '
-                      f'y={yoffset}')
+        self.log.info('Clicking element %s at coordinates x=%s, y=%s',
+                      locator, xoffset, yoffset)
         element = self.find_element(locator)
         action = ActionChains(self.driver)
         action.move_to_element(element)
@@ -58,19 +209,22 @@ class Element(Base):
         action.click()
         action.perform()
 
-    def double_click_element(self, locator):
+    def double_click_element(self, locator, cached=False):
         """
         Double click element identified by the locator
 
         See `find_element` method in `_base.py` for ``locator`` usage/syntax
 
         :param locator: WebElement or str
+        :param cached: bool - reuse the element of an earlier cached lookup
+            (see `find_element`)
         :return: NoReturn
         """
-        self.log.info(f'Double clicking element {locator}')
-        element = self.find_element(locator)
-        action = ActionChains(self.driver)
-        action.double_click(element).perform()
+        self.log.info('Double clicking element %s', locator)
+        self._on_element(
+            locator,
+            lambda element: ActionChains(self.driver).double_click(element).perform(),
+            cached)
 
     def drag_and_drop(self, locator, target):
         """
@@ -84,7 +238,7 @@ class Element(Base):
         :param target: WebElement or str
         :return: NoReturn
         """
-        self.log.info(f'Dragging {locator} onto {target}')
+        self.log.info('Dragging %s onto %s', locator, target)
         element = self.find_element(locator)
         target = self.find_element(target)
         action = ActionChains(self.driver)
@@ -103,8 +257,8 @@ class Element(Base):
         :param yoffset: Y offset to move to, as a positive or negative integer.
         :return: NoReturn
         """
-        self.log.info(f'Dragging {locator} {xoffset} px on the x axis and '
-                      f'{yoffset} px on the y axis')
+        self.log.info('Dragging %s %s px on the x axis and %s px on the y '
+                      'axis', locator, xoffset, yoffset)
         element = self.find_element(locator)
         action = ActionChains(self.driver)
         action.drag_and_drop_by_offset(element, int(xoffset), int(yoffset))
@@ -112,7 +266,8 @@ class Element(Base):
 
     def element_text_contains(self, locator, expected, ignore_case=True):
         """
-        See if an expected text exists in an element.
+        See if an expected text exists in an element. A missing element
+        returns False right away, without waiting for the implicit wait.
 
         See `find_element` method in `_base.py` for ``locator`` usage/syntax
 
@@ -122,16 +277,16 @@ class Element(Base):
             sensitive
         :return: bool - confirms that text exists or not in the element
         """
-        element = self.find_element(locator, required=False)
-        if element is not None:
-            text = element.text.lower() if ignore_case else element.text
-            expected = expected.lower() if ignore_case else expected
-            return expected in text
-        return False  # element not found
+        text = self._get_element_text(locator, ignore_case)
+        if text is None:
+            return False  # element not found
+        return (expected.lower() if ignore_case else expected) in text
 
     def element_text_is(self, locator, expected, ignore_case=False):
         """
-        See if an expected text is equal to the element's text.
+        See if an expected text is equal to the element's text. A missing
+        element returns False right away, without waiting for the implicit
+        wait.
 
         See `find_element` method in `_base.py` for ``locator`` usage/syntax
 
@@ -140,14 +295,12 @@ class Element(Base):
         :param ignore_case:
         :return:
         """
-        element = self.find_element(locator, required=False)
-        if element is not None:
-            text = element.text.lower() if ignore_case else element.text
-            expected = expected.lower() if ignore_case else expected
-            return text == expected
-        return False  # element not found
+        text = self._get_element_text(locator, ignore_case)
+        if text is None:
+            return False  # element not found
+        return text == (expected.lower() if ignore_case else expected)
 
-    def get_element_attribute(self, locator, attribute):
+    def get_element_attribute(self, locator, attribute, cached=False):
         """
         Get an element's attribute such as:
         <input type="text" value="Name:"> if ``attribute`` is 'value'
@@ -157,11 +310,14 @@ class Element(Base):
 
         :param locator: WebElement or str
         :param attribute: str
+        :param cached: bool - reuse the element of an earlier cached lookup
+            (see `find_element`)
         :return: str
         """
-        return self.find_element(locator).get_attribute(attribute)
+        return self._on_element(
+            locator, lambda element: element.get_attribute(attribute), cached)
 
-    def get_element_property(self, locator, prop):
+    def get_element_property(self, locator, prop, cached=False):
         """
         Get an element's property such as:
         <input type="text" value="Name:"> if property is value
@@ -171,32 +327,39 @@ class Element(Base):
 
         :param locator: WebElement or str
         :param prop: str
+        :param cached: bool - reuse the element of an earlier cached lookup
+            (see `find_element`)
         :return: str
         """
-        return self.find_element(locator).get_property(prop)
+        return self._on_element(
+            locator, lambda element: element.get_property(prop), cached)
 
-    def get_element_size(self, locator):
+    def get_element_size(self, locator, cached=False):
         """
         returns the width and height of the element as integers
 
         See `find_element` method in `_base.py` for ``locator`` usage/syntax
 
         :param locator: WebElement or str
+        :param cached: bool - reuse the element of an earlier cached lookup
+            (see `find_element`)
         :return: int, int
         """
-        element = self.find_element(locator)
-        return element.size['width'], element.size['height']
+        size = self._on_element(locator, lambda element: element.size, cached)
+        return size['width'], size['height']
 
-    def get_text(self, locator):
+    def get_text(self, locator, cached=False):
         """
         return the text of an element
 
         See `find_element` method in `_base.py` for ``locator`` usage/syntax
 
         :param locator: WebElement or str
+        :param cached: bool - reuse the element of an earlier cached lookup
+            (see `find_element`)
         :return: str
         """
-        return self.find_element(locator).text
+        return self._on_element(locator, lambda element: element.text, cached)
 
     def page_contains_text(self, text):
         """
@@ -206,20 +369,19 @@ class Element(Base):
         :param text: str - text we want to assert is present
         :return: bool
         """
+        self.clear_element_cache()
         self.driver.switch_to.default_content()
-        if self.is_text_present(text):
-            return True
-
-        frames = self.find_elements('xpath://frame|//iframe')
-        for frame in frames:
+        found = self.driver.execute_script(_PAGE_CONTAINS_TEXT_SCRIPT, text)
+        if found is not None:
+            return found
+        # cross-origin frames can't be read from the page, check them one by one
+        for frame in self.find_elements('xpath://frame|//iframe'):
             self.driver.switch_to.frame(frame)
-            if self.is_text_present(text):
-                self.driver.switch_to.frame(frame)
-                found_text = self.is_text_present(text)
-                self.driver.switch_to.default_content()
-                if found_text:
-                    return True
-            return False
+            found_text = self.is_text_present(text)
+            self.driver.switch_to.default_content()
+            if found_text:
+                return True
+        return False
 
     def right_click_element_at_coordinates(self, locator, xoffset, yoffset):
         """
@@ -233,9 +395,8 @@ class Element(Base):
         :param yoffset: Y offset to move to, as a positive or negative integer.
         :return:
         """
-        self.log.info('Clicking element {} at coordinates x={}, y={}'.format(
-            locator, xoffset, yoffset
-        ))
+        self.log.info('Clicking element %s at coordinates x=%s, y=%s',
+                      locator, xoffset, yoffset)
         element = self.find_element(locator)
         action = ActionChains(self.driver)
         action.move_to_element(element)
@@ -272,9 +433,9 @@ class Element(Base):
         """
         parsed_keys = self._parse_keys(*keys)
         if locator is not None:
-            self.log.info(f'Sending key(s) {keys} to {locator} element.')
+            self.log.info('Sending key(s) %s to %s element.', keys, locator)
         else:
-            self.log.info(f'Sending key(s) {str(keys)} to page.')
+            self.log.info('Sending key(s) %s to page.', keys)
         self._press_keys(locator, parsed_keys)
 
     def highlight_elements(self, locator):
@@ -291,25 +452,11 @@ class Element(Base):
         if not elements:
             self.log.info('Attempted to highlight elements, but none were found.')
             return
-        self.log.info('Highlighting {} element(s)'.format(len(elements)))
-        for element in elements:
-            script = """
-                old_element = arguments[0];
-                let newDiv = document.createElement('div');
-                newDiv.setAttribute("name", "covered");
-                newDiv.style.backgroundColor = 'blue';
-                newDiv.style.zIndex = '999';
-                newDiv.style.top = old_element.offsetTop + 'px';
-                newDiv.style.left = old_element.offsetLeft + 'px';
-                newDiv.style.height = old_element.offsetHeight + 'px';
-                newDiv.style.width = old_element.offsetWidth + 'px';
-                old_element.parentNode.insertBefore(newDiv, old_element);
-                old_element.remove();
-                newDiv.parentNode.style.overflow = 'hidden';
-            """
-            self.driver.execute_script(script, element)
-
-    def mouse_down(self, locator):
+        self.log.info('Highlighting %s element(s)', len(elements))
+        # every element in one call rather than a round-trip each
+        self.driver.execute_script(_HIGHLIGHT_SCRIPT, elements)
+
+    def mouse_down(self, locator, cached=False):
         """
         Simulates pressing the left mouse button on the element ``locator``.
         The element is pressed without releasing the mouse button.
@@ -317,81 +464,104 @@ class Element(Base):
         See `find_element` method in `_base.py` for ``locator`` usage/syntax
 
         :param locator: WebElement or str
+        :param cached: bool - reuse the element of an earlier cached lookup
+            (see `find_element`)
         :return: NoReturn
         """
-        self.log.info(f'Simulating Mouse Down on element {locator}.')
-        element = self.find_element(locator)
-        action = ActionChains(self.driver)
-        action.click_and_hold(element).perform()
+        self.log.info('Simulating Mouse Down on element %s.', locator)
+        self._on_element(
+            locator,
+            lambda element: ActionChains(self.driver).click_and_hold(element).perform(),
+            cached)
 
-    def mouse_out(self, locator):
+    def mouse_out(self, locator, cached=False):
         """
         Simulates moving mouse away from the element ``locator``.
 
         See `find_element` method in `_base.py` for ``locator`` usage/syntax
 
         :param locator: WebElement or str
+        :param cached: bool - reuse the element of an earlier cached lookup
+            (see `find_element`)
         :return: NoReturn
         """
-        self.log.info(f'Simulating Mouse Out on element {locator}.')
-        element = self.find_element(locator)
-        size = element.size
-        offsetx = (size['width'] / 2) + 1
-        offsety = (size['height'] / 2) + 1
-        action = ActionChains(self.driver)
-        action.move_to_element(element).move_by_offset(offsetx, offsety)
-        action.perform()
+        self.log.info('Simulating Mouse Out on element %s.', locator)
+        def move_out(element):
+            size = element.size
+            offsetx = (size['width'] / 2) + 1
+            offsety = (size['height'] / 2) + 1
+            action = ActionChains(self.driver)
+            action.move_to_element(element).move_by_offset(offsetx, offsety)
+            action.perform()
+        self._on_element(locator, move_out, cached)
 
-    def mouse_over(self, locator):
+    def mouse_over(self, locator, cached=False):
         """
         Simulates hovering mouse over the element ``locator``.
 
         See `find_element` method in `_base.py` for ``locator`` usage/syntax
 
         :param locator: WebElement or str
+        :param cached: bool - reuse the element of an earlier cached lookup
+            (see `find_element`)
         :return: NoReturn
         """
-        self.log.info(f'Simulating Mouse Over on element {locator}.')
-        element = self.find_element(locator)
-        action = ActionChains(self.driver)
-        action.move_to_element(element).perform()
+        self.log.info('Simulating Mouse Over on element %s.', locator)
+        self._on_element(
+            locator,
+            lambda element: ActionChains(self.driver).move_to_element(element).perform(),
+            cached)
 
-    def mouse_up(self, locator):
+    def mouse_up(self, locator, cached=False):
         """
         Simulates releasing the left mouse button on the element ``locator``.
 
         See `find_element` method in `_base.py` for ``locator`` usage/syntax
 
         :param locator: WebElement or str
+        :param cached: bool - reuse the element of an earlier cached lookup
+            (see `find_element`)
         :return: NoReturn
         """
-        self.log.info(f'Simulating Mouse Up on element {locator}.')
-        element = self.find_element(locator)
-        ActionChains(self.driver).release(element).perform()
+        self.log.info('Simulating Mouse Up on element %s.', locator)
+        self._on_element(
+            locator,
+            lambda element: ActionChains(self.driver).release(element).perform(),
+            cached)
 
-    def set_focus_to_element(self, locator):
+    def set_focus_to_element(self, locator, cached=False):
         """
         Sets focus to element identified by the locator.
 
         See `find_element` method in `_base.py` for ``locator`` usage/syntax
 
         :param locator: WebElement or str
+        :param cached: bool - reuse the element of an earlier cached lookup
+            (see `find_element`)
         :return: NoReturn
         """
-        element = self.find_element(locator)
-        self.driver.execute_script("arguments[0].focus();", element)
+        self._on_element(
+            locator,
+            lambda element: self.driver.execute_script("arguments[0].focus();",
+                                                       element),
+            cached)
 
-    def scroll_element_into_view(self, locator):
+    def scroll_element_into_view(self, locator, cached=False):
         """
         Scrolls an element identified by ``locator`` into view.
 
         See `find_element` method in `_base.py` for ``locator`` usage/syntax
 
         :param locator: WebElement or str
+        :param cached: bool - reuse the element of an earlier cached lookup
+            (see `find_element`)
         :return: NoReturn
         """
-        element = self.find_element(locator)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        self._on_element(
+            locator,
+            lambda element: self.driver.execute_script(
+                "arguments[0].scrollIntoView(true);", element),
+            cached)
 
     def simulate_event(self, locator, event):
         """
@@ -405,17 +575,7 @@ class Element(Base):
         :return: NoReturn
         """
         element = self.find_element(locator)
-        script = """
-            element = arguments[0];
-            eventName = arguments[1];
-            if (document.createEventObject) { // IE
-                return element.fireEvent(eventName, document.createEventObject());
-            }
-            var evt = document.createEvent("HTMLEvents");
-            evt.initEvent(eventName, true, true);
-            return !element.dispatchEvent(evt);
-            """
-        self.driver.execute_script(script, element, event)
+        self.driver.execute_script(_SIMULATE_EVENT_SCRIPT, element, event)
 
     def _press_keys(self, locator, parsed_keys):
         element = None
@@ -423,6 +583,11 @@ class Element(Base):
             element = self.find_element(locator)
 
         actions = ActionChains(self.driver)
+        self._queue_keys(actions, element, parsed_keys)
+        actions.perform()
+
+    def _queue_keys(self, actions, element, parsed_keys):
+        # add the presses of ``parsed_keys`` to the ``actions`` chain
         keys_down = []
         for key in parsed_keys:
             if key.key_code is None:
@@ -437,21 +602,24 @@ class Element(Base):
                     self._press_special_keys(actions, key)
                     keys_down.append(key)
         for key_down in keys_down:
-            self.log.info(f'Releasing special key {key_down.original}.')
+            self.log.info('Releasing special key %s.', key_down.original)
             actions.key_up(key_down.key_code)
-        actions.perform()
+
+    def _get_element_text(self, locator, lower=False):
+        # text of the element, in a single round-trip; None if not found
+        with self._no_implicit_wait():
+            element = self.find_element(locator, required=False)
+        if element is None:
+            return None
+        text = element.text
+        return text.lower() if lower else text
 
     def _parse_keys(self, *keys):
         if not keys:
             raise AssertionError('"keys" argument can not be empty.')
         list_keys = []
         for key in keys:
-            Key = namedtuple('Key', 'original, key_code')
-            parsed_key = self._parse_alias(key)
-            if hasattr(Keys, self._parse_alias(key)):
-                list_keys.append(Key(key, getattr(Keys, parsed_key)))
-            else:
-                list_keys.append(Key(key, None))
+            list_keys.append(Key(key, _SELENIUM_KEYS.get(self._parse_alias(key))))
         return list_keys
 
     def _parse_alias(self, key):
@@ -465,12 +633,12 @@ class Element(Base):
         return key
 
     def _press_normal_keys(self, actions, element, key):
-        self.log.info(f'Sending key(s) {key}')
+        self.log.info('Sending key(s) %s', key)
         if element:
             actions.send_keys_to_element(element, key)
         else:
             actions.send_keys(key)
 
     def _press_special_keys(self, actions, key):
-        self.log.info(f'Pressing special key {key.original} down.')
+        self.log.info('Pressing special key %s down.', key.original)
         actions.key_down(key.key_code)
@@ -3,6 +3,7 @@ from ._base import Base
 
 
 class Frames(Base):
+    __slots__ = ()
 
     def __init__(self, root):
         super().__init__(root)
@@ -32,7 +33,7 @@ class Frames(Base):
         self.log.info('Sending method `{}` to element `{}`'.format(
             method, element_locator))
         to_return = method(element_locator)
-        self.driver.switch_to.default_content()
+        self.unselect_frame()
         return to_return
 
     def switch_to_frame(self, locator_or_index):
@@ -56,10 +57,12 @@ class Frames(Base):
         else:
             # get element if the locator is not an integer
             locator = self.find_element(locator_or_index)
+        self.clear_element_cache()
         self.driver.switch_to.frame(locator)
 
     def unselect_frame(self):
         """
         Sets the main frame as the current frame.
         """
+        self.clear_element_cache()
         self.driver.switch_to.default_content()
@@ -9,6 +9,7 @@ from ._driver import Driver
 
 
 class Javascript(Driver):
+    __slots__ = ()
 
     def __init__(self, root):
         super().__init__(root)
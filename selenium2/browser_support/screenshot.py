@@ -5,6 +5,7 @@ from ._base import Base
 
 
 class Screenshot(Base):
+    __slots__ = ()
 
     def __init__(self, root):
         super().__init__(root)
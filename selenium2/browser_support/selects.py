@@ -3,8 +3,12 @@ from selenium.webdriver.support.ui import Select
 from ..logger import Logger
 from ._base import Base
 
+# values of every <option> passed in, fetched in a single round-trip
+_OPTION_VALUES_SCRIPT = 'return arguments[0].map(function (o) { return o.value; });'
+
 
 class Selects(Base):
+    __slots__ = ()
 
     def __init__(self, root):
         super().__init__(root)
@@ -258,10 +262,12 @@ class Selects(Base):
         return [opt.text for opt in options]
 
     def _get_values(self, options):
-        return [opt.get_attribute('value') for opt in options]
+        if not options:
+            return []
+        return self.driver.execute_script(_OPTION_VALUES_SCRIPT, options)
 
     def _get_values_and_labels(self, options):
-        return [(opt.get_attribute('value'), opt.text) for opt in options]
+        return list(zip(self._get_values(options), self._get_labels(options)))
 
     def _get_selected_options(self, locator):
         return self._get_select_list(locator).all_selected_options
@@ -3,6 +3,7 @@ from ._base import Base
 
 
 class Tables(Base):
+    __slots__ = ()
 
     def __init__(self, root):
         super().__init__(root)
@@ -17,6 +17,8 @@ class Testing(Screenshot):
     layout differences based on HTML structure.
     """
 
+    __slots__ = ()
+
     def __init__(self, root):
         super().__init__(root)
         self.log = Logger.get_logger()
@@ -7,6 +7,7 @@ from ._base import Base
 
 
 class Waiting(Base):
+    __slots__ = ()
 
     def __init__(self, root):
         super().__init__(root)
@@ -11,6 +11,7 @@ WindowInfo = namedtuple('WindowInfo', 'handle, id, name, title, url')
 
 
 class WindowManager(Driver):
+    __slots__ = ('_selectors',)
 
     def __init__(self, root):
         super().__init__(root)
@@ -65,11 +66,13 @@ class WindowManager(Driver):
         """
         epoch = time.time()
         timeout = timeout + epoch
+        self.clear_element_cache()
         return self._select(locator, timeout)
 
     def close_window(self):
         """Closes currently opened pop-up window."""
         self.log.info('Closing current active window.')
+        self.clear_element_cache()
         self.driver.close()
 
     def get_all_windows_handles(self):
@@ -148,7 +151,7 @@ class WindowManager(Driver):
         :return: NoReturn
         """
         self.log.info('Setting window id to "{}"'.format(id))
-        self.driver.execute_script('window.id = "{}";'.format(id))
+        self.driver.execute_script('window.id = arguments[0];', str(id))
 
     def set_window_name(self, name):
         """
@@ -158,7 +161,7 @@ class WindowManager(Driver):
         :return: NoReturn
         """
         self.log.info('Setting window name to "{}"'.format(name))
-        self.driver.execute_script('window.name = "{}";'.format(name))
+        self.driver.execute_script('window.name = arguments[0];', str(name))
 
     def set_window_position(self, x, y):
         """
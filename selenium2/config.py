@@ -10,5 +10,11 @@ SCREENSHOT_ROOT_DIRECTORY = os.environ.get('SELENIUM2_SCREENSHOT_PATH', 'screens
 REPORT_ROOT_DIRECTORY = os.environ.get('SELENIUM2_REPORT_PATH', 'reports')
 COOKIE_ROOT_DIRECTORY = os.environ.get('SELENIUM2_COOKIE_PATH', 'cookies')
 
+# directory for browser profiles kept between sessions, unset uses throwaway ones
+PROFILE_ROOT_DIRECTORY = os.environ.get('SELENIUM2_PROFILE_PATH')
+
+# idle drivers kept per browser for reuse by later sessions, 0 disables pooling
+DRIVER_POOL_SIZE = int(os.environ.get('SELENIUM2_DRIVER_POOL_SIZE', 0))
+
 # running speed of the script
 DEFAULT_SPEED = os.environ.get('DEFAULT_SPEED', 0.0)
\ No newline at end of file
@@ -1,6 +1,6 @@
 import logging
-import inspect
 import os
+import sys
 from os.path import basename
 
 
@@ -51,9 +51,11 @@ class Logger:
 
     @staticmethod
     def get_caller_filename():
-        # get the caller's stack frame and extract its filename
-        frame_info = inspect.stack()[2]     # go 2 stacks down : get_caller_filename > Logger.__init__ > calling file
-        path = frame_info.filename
+        # get the caller's stack frame and extract its filename. sys._getframe
+        # reads one frame where inspect.stack() builds (and reads the source
+        # lines of) every frame on the stack
+        frame = sys._getframe(2)     # go 2 stacks down : get_caller_filename > Logger.__init__ > calling file
+        path = frame.f_code.co_filename
         filename = basename(path)
         if len(filename) < 3:
             # return entire path in case of failed filename extraction